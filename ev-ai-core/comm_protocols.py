@@ -253,6 +253,8 @@ class MultiProtocolAgent:
         try:
             from urllib.parse import parse_qs
 
+            if isinstance(body, (bytes, bytearray)):
+                body = body.decode()
             data = parse_qs(body)
             text = data.get("text", [""])[0]
             user = data.get("user_name", ["user"])[0]
@@ -255,17 +255,18 @@ async def decode_base64(data: str) -> str:
     return base64.b64decode(data.encode()).decode()
 
 
+_hashes = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+}
+
+
 async def hash_data(data: str, algorithm: str = "sha256") -> str:
     """Hash data"""
-    if algorithm == "md5":
-        return hashlib.md5(data.encode()).hexdigest()
-    elif algorithm == "sha1":
-        return hashlib.sha1(data.encode()).hexdigest()
-    elif algorithm == "sha256":
-        return hashlib.sha256(data.encode()).hexdigest()
-    elif algorithm == "sha512":
-        return hashlib.sha512(data.encode()).hexdigest()
-    return hashlib.sha256(data.encode()).hexdigest()
+    # dict dispatch, sha256 fallback as before
+    return _hashes.get(algorithm, hashlib.sha256)(data.encode()).hexdigest()
 
 
 async def hash_file(path: str, algorithm: str = "sha256") -> str:
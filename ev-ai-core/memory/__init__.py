@@ -1,6 +1,6 @@
 # v2026-02-efficient-r1 - Memory system
 import json, os, sqlite3
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Tuple
 from pathlib import Path
 
 
@@ -28,6 +28,14 @@ class MemorySystem:
         )
         self.c.commit()
 
+    def store_many(self, items: Iterable[Tuple[str, Any, str]]):
+        # one transaction/fsync for the whole batch instead of one per row
+        with self.c:
+            self.c.executemany(
+                "INSERT OR REPLACE INTO memories(k,v,c,i) VALUES(?,?,?,1)",
+                [(k, json.dumps(v), c) for k, v, c in items],
+            )
+
     def recall(self, k: str) -> Optional[Any]:
         self.c.execute("UPDATE memories SET ac=ac+1 WHERE k=?", (k,))
         self.c.commit()
@@ -1,10 +1,36 @@
 # v2026-02-efficient-r1 - Server framework (HTTP/WS/TCP)
-import asyncio, json, websockets, http.server, socketserver, threading
+import asyncio, json, re, websockets, http.server, socketserver, threading
 from typing import Any, Callable, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 import ssl
 
+try:
+    import orjson
+
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps = lambda o: json.dumps(o).encode()
+    _loads = json.loads
+
+# Cheap "event" sniff so unregistered messages skip the full JSON parse
+_EV_RX = re.compile(r'"event"\s*:\s*"([^"]+)"')
+
+# Precompiled header blocks: one write per response, no per-request
+# string formatting in send_response/send_header
+_H200 = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: keep-alive\r\n"
+_H500 = b"HTTP/1.1 500 Internal Server Error\r\nContent-Type: application/json\r\nConnection: keep-alive\r\n"
+_H404 = b"HTTP/1.1 404 Not Found\r\nContent-Type: application/json\r\nConnection: keep-alive\r\nContent-Length: 0\r\n\r\n"
+
+# Fixed-shape error payloads: concat beats running the full encoder
+# str on purpose: WS replies stay text frames (orjson bytes would flip
+# them to binary and change what clients see)
+_INVALID = '{"e":"Invalid JSON"}'
+
+
+def _err_body(e):
+    return b'{"e":' + _dumps(str(e)) + b"}"
+
 
 class ServerType(Enum):
     HTTP = "http"
@@ -23,56 +49,98 @@ class HTTPServer:
     def __init__(self, host="0.0.0.0", port=8080):
         self.host, self.port = host, port
         self.routes: Dict[str, Dict[str, Callable]] = {}
+        self._flat: Dict[tuple, Callable] = {}  # (path, METHOD) -> handler
         self.server = None
         self.thread = None
+        self._loop = None  # shared loop for async handlers
+        self._loop_lock = threading.Lock()
 
     def route(self, path, method="GET"):
         def dec(func):
             self.routes.setdefault(path, {})[method.upper()] = func
+            self._flat[(path, method.upper())] = self._specialize(
+                func, method.upper()
+            )
             return func
 
         return dec
 
+    def _specialize(self, func, method):
+        # Bake async-ness and argument shape in at registration time so
+        # per-request dispatch is one dict lookup plus one call
+        is_async = asyncio.iscoroutinefunction(func)
+        if method in ("POST", "PUT"):
+            if is_async:
+
+                def do_fn(req, _f=func):
+                    l = int(req.headers.get("Content-Length", 0))
+                    return asyncio.run_coroutine_threadsafe(
+                        _f(req.rfile.read(l) if l else None), self._ensure_loop()
+                    ).result()
+
+            else:
+
+                def do_fn(req, _f=func):
+                    l = int(req.headers.get("Content-Length", 0))
+                    return _f(req.rfile.read(l) if l else None)
+
+        else:  # GET/DELETE handlers take the request path
+            if is_async:
+
+                def do_fn(req, _f=func):
+                    return asyncio.run_coroutine_threadsafe(
+                        _f(req.path), self._ensure_loop()
+                    ).result()
+
+            else:
+
+                def do_fn(req, _f=func):
+                    return _f(req.path)
+
+        return do_fn
+
     def _make_handler(self):
         import asyncio
 
         class H(http.server.BaseHTTPRequestHandler):
             server_instance = self  # Store reference to our server
+            protocol_version = "HTTP/1.1"  # keep-alive amortizes headers
+
+            def _drain(self):
+                # keep-alive: any unread body bytes would be parsed as the
+                # start of the next pipelined request
+                l = int(self.headers.get("Content-Length", 0))
+                if l:
+                    self.rfile.read(l)
 
             def do_method(m):
+                handler_reads_body = m in ("POST", "PUT")
+
                 def h(self):
-                    p = self.path.split("?")[0]
-                    if (
-                        p in self.server_instance.routes
-                        and m in self.server_instance.routes[p]
-                    ):
+                    # partition beats split("?"): no list alloc, stops at 1st ?
+                    do_fn = self.server_instance._flat.get(
+                        (self.path.partition("?")[0], m)
+                    )
+                    if do_fn is not None:
+                        if not handler_reads_body:
+                            self._drain()
                         try:
-                            handler = self.server_instance.routes[p][m]
-                            l = int(self.headers.get("Content-Length", 0))
-                            b = self.rfile.read(l).decode() if l else None
-
-                            # Handle async handlers
-                            if asyncio.iscoroutinefunction(handler):
-                                loop = asyncio.new_event_loop()
-                                try:
-                                    r = loop.run_until_complete(handler(b))
-                                finally:
-                                    loop.close()
-                            else:
-                                r = handler(b)
-
-                            self.send_response(200)
-                            self.send_header("Content-Type", "application/json")
-                            self.end_headers()
-                            self.wfile.write(json.dumps(r).encode())
+                            body = _dumps(do_fn(self))
+                            self.wfile.write(
+                                _H200
+                                + b"Content-Length: %d\r\n\r\n" % len(body)
+                                + body
+                            )
                         except Exception as e:
-                            self.send_response(500)
-                            self.send_header("Content-Type", "application/json")
-                            self.end_headers()
-                            self.wfile.write(json.dumps({"e": str(e)}).encode())
+                            body = _err_body(e)
+                            self.wfile.write(
+                                _H500
+                                + b"Content-Length: %d\r\n\r\n" % len(body)
+                                + body
+                            )
                     else:
-                        self.send_response(404)
-                        self.end_headers()
+                        self._drain()
+                        self.wfile.write(_H404)
 
                 return h
 
@@ -86,10 +154,23 @@ class HTTPServer:
 
         return H
 
+    def _ensure_loop(self):
+        # double-checked: request threads race here under ThreadingTCPServer
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
     def start(self, block=True):
-        self.server = socketserver.TCPServer(
+        # threading server: keep-alive connections must not serialize
+        # (or wedge shutdown behind) other clients
+        self.server = socketserver.ThreadingTCPServer(
             (self.host, self.port), self._make_handler()
         )
+        self.server.daemon_threads = True
         print(f"HTTP on {self.host}:{self.port}")
         if block:
             self.server.serve_forever()
@@ -101,14 +182,23 @@ class HTTPServer:
 
     def stop(self):
         self.server and self.server.shutdown()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
 
 
 class WebSocketServer:
+    BCAST_CHUNK = 128  # max in-flight sends per broadcast batch
+    BCAST_TIMEOUT = 5.0  # seconds before a slow client is dropped
+
     def __init__(self, host="0.0.0.0", port=8765):
         self.host, self.port = host, port
-        self.clients = set()
+        self._clients_set = set()
+        self._clients_snapshot: tuple = ()  # rebuilt only on membership change
         self.handlers: Dict[str, Callable] = {}
         self.server = None
+        self._loop = None  # cached running loop (set in start)
+        self._bcast_sem = asyncio.Semaphore(self.BCAST_CHUNK)
 
     def on(self, event):
         def dec(func):
@@ -117,29 +207,71 @@ class WebSocketServer:
 
         return dec
 
+    @property
+    def clients(self):
+        return self._clients_set
+
+    def _add(self, ws):
+        self._clients_set.add(ws)
+        self._clients_snapshot = tuple(self._clients_set)
+
+    def _drop(self, ws):
+        self._clients_set.discard(ws)
+        self._clients_snapshot = tuple(self._clients_set)
+
     async def handle_client(self, ws, path):
-        self.clients.add(ws)
+        self._add(ws)
         try:
             async for msg in ws:
                 try:
-                    d = json.loads(msg)
-                    e = d.get("event", "message")
-                    if e in self.handlers:
-                        r = await self.handlers[e](d.get("data", {}), ws)
-                        if r:
-                            await ws.send(json.dumps(r))
-                except json.JSONDecodeError:
-                    await ws.send(json.dumps({"e": "Invalid JSON"}))
+                    if isinstance(msg, bytes):
+                        msg = msg.decode()
+                    # sniff the event name before paying for a full parse;
+                    # list frames (bursts) always get parsed
+                    if not msg.lstrip().startswith("["):
+                        mt = _EV_RX.search(msg)
+                        if mt and mt.group(1) not in self.handlers:
+                            continue
+                    d = _loads(msg)
+                    # clients may coalesce bursts into one list frame
+                    for item in d if isinstance(d, list) else (d,):
+                        e = item.get("event", "message")
+                        if e in self.handlers:
+                            r = await self.handlers[e](item.get("data", {}), ws)
+                            if r:
+                                # json.dumps: replies stay text frames
+                                await ws.send(json.dumps(r))
+                except ValueError:  # covers orjson and stdlib decode errors
+                    await ws.send(_INVALID)
         finally:
-            self.clients.discard(ws)
+            self._drop(ws)
 
     async def broadcast(self, msg):
-        if self.clients:
-            await asyncio.gather(
-                *[c.send(json.dumps(msg)) for c in self.clients], return_exceptions=True
-            )
+        # immutable snapshot: zero-alloc iteration, safe against
+        # concurrent connect/disconnect mutating the set
+        snap = self._clients_snapshot
+        if not snap:
+            return
+        payload = json.dumps(msg)  # text frame, see _INVALID note
+        failed = []
+
+        async def _one(c):
+            async with self._bcast_sem:
+                try:
+                    await asyncio.wait_for(c.send(payload), self.BCAST_TIMEOUT)
+                except Exception:
+                    failed.append(c)
+
+        # chunked gather keeps the task count bounded and the sleep(0)
+        # gives other coroutines a scheduling point between batches
+        for i in range(0, len(snap), self.BCAST_CHUNK):
+            await asyncio.gather(*(_one(c) for c in snap[i : i + self.BCAST_CHUNK]))
+            await asyncio.sleep(0)
+        for c in failed:
+            self._drop(c)
 
     async def start(self):
+        self._loop = asyncio.get_running_loop()
         self.server = await websockets.serve(self.handle_client, self.host, self.port)
         print(f"WS on ws://{self.host}:{self.port}")
 
@@ -147,38 +279,67 @@ class WebSocketServer:
         self.server and self.server.close()
 
 
+class _TCPConn(asyncio.BufferedProtocol):
+    """Per-connection protocol reusing one receive buffer (no per-read alloc)."""
+
+    def __init__(self, server):
+        self.server = server
+        self._buf = bytearray(65536)
+        self._mv = memoryview(self._buf)
+        self.transport = None
+        self.addr = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.addr = transport.get_extra_info("peername")
+        self.server.clients[transport] = self.addr
+
+    def get_buffer(self, sizehint):
+        return self._mv
+
+    def buffer_updated(self, nbytes):
+        if self.server.handler:
+            # pause until the handler replies so messages stay ordered;
+            # hand the handler bytes — no UTF-8 round trip on the hot path
+            self.transport.pause_reading()
+            self.server._loop.create_task(self._respond(bytes(self._mv[:nbytes])))
+
+    async def _respond(self, m):
+        try:
+            rply = await self.server.handler(m, self.addr)
+            if rply:
+                if isinstance(rply, (list, tuple)):
+                    # burst reply: one writelines -> one sendmsg when possible
+                    self.transport.writelines(
+                        [c if isinstance(c, (bytes, bytearray)) else c.encode() for c in rply]
+                    )
+                else:
+                    if not isinstance(rply, (bytes, bytearray)):
+                        rply = rply.encode()
+                    self.transport.write(rply)
+        finally:
+            self.transport.resume_reading()
+
+    def connection_lost(self, exc):
+        self.server.clients.pop(self.transport, None)
+
+
 class TCPServer:
     def __init__(self, host="0.0.0.0", port=9999):
         self.host, self.port = host, port
-        self.clients = []
+        self.clients = {}  # transport -> addr, O(1) add/remove
         self.handler = None
         self.server = None
+        self._loop = None  # cached running loop (set in start)
 
     def on_message(self, func):
         self.handler = func
         return func
 
-    async def handle_client(self, r, w):
-        addr = w.get_extra_info("peername")
-        self.clients.append((addr, w))
-        try:
-            while True:
-                d = await r.read(100)
-                if not d:
-                    break
-                m = d.decode()
-                if self.handler:
-                    rply = await self.handler(m, addr)
-                    if rply:
-                        w.write(rply.encode())
-                        await w.drain()
-        finally:
-            self.clients.remove((addr, w))
-            w.close()
-
     async def start(self):
-        self.server = await asyncio.start_server(
-            self.handle_client, self.host, self.port
+        self._loop = asyncio.get_running_loop()
+        self.server = await self._loop.create_server(
+            lambda: _TCPConn(self), self.host, self.port
         )
         print(f"TCP on {self.host}:{self.port}")
         async with self.server:
@@ -193,6 +354,8 @@ class WSClient:
         self.url = url
         self.ws = None
         self.handlers = {}
+        self._out = None  # outbound queue drained by _sender
+        self._loop = None  # cached running loop (set in connect)
 
     def on(self, event):
         def dec(func):
@@ -202,72 +365,136 @@ class WSClient:
         return dec
 
     async def connect(self):
+        self._loop = asyncio.get_running_loop()
         self.ws = await websockets.connect(self.url)
-        asyncio.create_task(self._recv())
+        self._out = asyncio.Queue()
+        self._loop.create_task(self._recv())
+        self._loop.create_task(self._sender())
+
+    async def _sender(self):
+        # coalesce bursts: everything queued since the last frame goes
+        # out as one list frame instead of N frame+flush round trips
+        while self.ws:
+            batch = [await self._out.get()]
+            while True:
+                try:
+                    batch.append(self._out.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self.ws.send(_dumps(batch[0] if len(batch) == 1 else batch))
+            except websockets.exceptions.ConnectionClosed:
+                break  # normal disconnect, not an error in the drainer
+            finally:
+                # mark even failed sends done so close() can't hang on join
+                for _ in batch:
+                    self._out.task_done()
 
     async def _recv(self):
         async for m in self.ws:
             try:
-                d = json.loads(m)
-                e = d.get("event", "message")
-                if e in self.handlers:
-                    await self.handlers[e](d.get("data", {}))
+                probe = _EV_RX.search(m if isinstance(m, str) else m.decode())
+                e = probe.group(1) if probe else "message"
+                if e not in self.handlers:
+                    continue
+                d = _loads(m)
+                await self.handlers[e](d.get("data", {}))
             except:
                 pass
 
     async def send(self, event, data=None):
         if self.ws:
-            await self.ws.send(json.dumps({"event": event, "data": data}))
+            self._out.put_nowait({"event": event, "data": data})
 
     async def close(self):
         if self.ws:
+            await self._out.join()  # flush queued frames before closing
             await self.ws.close()
 
 
+class _TCPClientConn(asyncio.BufferedProtocol):
+    """Client side of the reused-buffer protocol: one rx buffer per client."""
+
+    def __init__(self):
+        self._buf = bytearray(4096)
+        self._mv = memoryview(self._buf)
+        self.transport = None
+        self.waiter = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        return self._mv
+
+    def buffer_updated(self, nbytes):
+        if self.waiter and not self.waiter.done():
+            self.waiter.set_result(str(self._mv[:nbytes], "utf-8"))
+
+    def connection_lost(self, exc):
+        if self.waiter and not self.waiter.done():
+            self.waiter.set_result("")
+
+
 class TCPClient:
     def __init__(self, host, port):
         self.host, self.port = host, port
-        self.r, self.w = None, None
+        self._proto = None
+        self._loop = None  # cached running loop (set in connect)
 
     async def connect(self):
-        self.r, self.w = await asyncio.open_connection(self.host, self.port)
+        self._loop = asyncio.get_running_loop()
+        _, self._proto = await self._loop.create_connection(
+            _TCPClientConn, self.host, self.port
+        )
 
     async def send(self, msg):
-        if not self.w:
+        if self._proto is None:
             await self.connect()
-        self.w.write(msg.encode())
-        await self.w.drain()
-        d = await self.r.read(100)
-        return d.decode()
+        self._proto.waiter = self._loop.create_future()
+        if not isinstance(msg, (bytes, bytearray)):
+            msg = msg.encode()
+        self._proto.transport.write(msg)
+        return await self._proto.waiter
 
     async def close(self):
-        if self.w:
-            self.w.close()
-            await self.w.wait_closed()
+        if self._proto is not None:
+            self._proto.transport.close()
+            self._proto = None
+
+
+_JSON_HDR = {"Content-Type": "application/json"}
 
 
 class JSONRPCClient:
     def __init__(self, url):
         self.url = url
         self.rid = 0
+        self._session = None  # lazy aiohttp session, reused across calls
 
     async def call(self, method, params=None):
-        import urllib.request, urllib.error
+        import aiohttp
 
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
         self.rid += 1
-        req = json.dumps(
+        payload = _dumps(
             {"jsonrpc": "2.0", "method": method, "params": params or {}, "id": self.rid}
-        ).encode()
-        try:
-            with urllib.request.Request(
-                self.url, data=req, headers={"Content-Type": "application/json"}
-            ) as r:
-                with urllib.request.urlopen(r) as resp:
-                    return json.loads(resp.read()).get("result")
-        except urllib.error.HTTPError as e:
-            raise Exception(
-                json.loads(e.read()).get("error", {}).get("message", str(e))
-            )
+        )
+        async with self._session.post(
+            self.url, data=payload, headers=_JSON_HDR
+        ) as resp:
+            body = await resp.read()
+            if resp.status >= 400:
+                raise Exception(
+                    _loads(body).get("error", {}).get("message", f"HTTP {resp.status}")
+                )
+            return _loads(body).get("result")
+
+    async def aclose(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
 
 create_api_server = lambda h="0.0.0.0", p=8080: HTTPServer(h, p)
@@ -1,10 +1,13 @@
 # v2026-02-efficient-r1 - Skills CLI system
-import subprocess, json, os
+import re, shlex, subprocess, json, os
+import ast, base64, datetime, functools, glob, heapq, platform, secrets, shutil, signal, string, threading, time, uuid
+import urllib.parse, urllib.request
 from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass, field
+from collections import defaultdict
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     name: str
     desc: str
@@ -19,42 +22,165 @@ class Skill:
 class S:
     def __init__(self):
         self.skills: Dict[str, Skill] = {}
-        self.cats: Dict[str, List[str]] = {}
+        self.cats: Dict[str, List[str]] = defaultdict(list)
+        self.alias: Dict[str, str] = {}  # alias -> canonical name
+        # registry only changes on reg/en/dis: memoize the read paths
+        self._list_cache: Optional[List[Dict]] = None
+        self._cat_cache: Dict[str, List[Skill]] = {}
+
+    def _dirty(self):
+        self._list_cache = None
+        self._cat_cache.clear()
 
     def reg(self, s: Skill):
+        old = self.skills.get(s.name)
+        if old is not None:
+            # re-registration replaces, matching the plain-dict baseline
+            # (last wins); unhook the old cat/alias entries first
+            self.cats[old.cat].remove(s.name)
+            for a in old.aliases:
+                self.alias.pop(a, None)
         self.skills[s.name] = s
-        self.cats.setdefault(s.cat, []).append(s.name)
+        self.cats[s.cat].append(s.name)
+        for a in s.aliases:
+            self.alias[a] = s.name
+        self._dirty()
+
+    def reg_many(self, skills):
+        for s in skills:
+            self.reg(s)
 
     def get(self, n: str) -> Optional[Skill]:
-        return self.skills.get(n)
+        return self.skills.get(n) or self.skills.get(self.alias.get(n, ""))
 
     def by_cat(self, c: str) -> List[Skill]:
-        return [self.skills[n] for n in self.cats.get(c, [])]
+        r = self._cat_cache.get(c)
+        if r is None:
+            r = self._cat_cache[c] = [self.skills[n] for n in self.cats.get(c, [])]
+        return r
 
     def list_all(self) -> List[Dict]:
-        return [
-            {"n": s.name, "d": s.desc, "c": s.cat, "a": s.aliases, "e": s.enabled}
-            for s in self.skills.values()
-            if not s.hidden
-        ]
+        if self._list_cache is None:
+            self._list_cache = [
+                {"n": s.name, "d": s.desc, "c": s.cat, "a": s.aliases, "e": s.enabled}
+                for s in self.skills.values()
+                if not s.hidden
+            ]
+        return self._list_cache
 
     def en(self, n: str):
         if n in self.skills:
             self.skills[n].enabled = True
+            self._dirty()
 
     def dis(self, n: str):
         if n in self.skills:
             self.skills[n].enabled = False
+            self._dirty()
 
 
 R = S()
 _s = subprocess.run
 
+# tool path cache: absolute executable + close_fds=False lets CPython
+# take the posix_spawn/vfork fast path instead of a full fork+exec
+_BIN: Dict[str, Optional[str]] = {}
+
+
+def _which(name: str) -> str:
+    p = _BIN.get(name)
+    if p is None:
+        p = _BIN[name] = shutil.which(name) or name
+    return p
+
+
+def _r(argv: List[str]) -> str:
+    # argv list, shell=False: no /bin/sh fork per skill call
+    exe = _which(argv[0]) if "/" not in argv[0] else argv[0]
+    return _s(
+        argv, executable=exe, capture_output=True, text=True, close_fds=False
+    ).stdout
+
+
+_POOL = None  # shared executor for fan-out commands, spawned on first use
+
+
+def _pool():
+    global _POOL
+    if _POOL is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _POOL = ThreadPoolExecutor(max_workers=4)
+    return _POOL
+
+
+def _r_many(cmds: List[List[str]]) -> List[str]:
+    # submit independent commands at once, reap as they finish:
+    # wall time max(t_i) instead of sum(t_i)
+    return list(_pool().map(_r, cmds))
 
-def _r(cmd: str) -> str:
+
+def _rsh(cmd: str) -> str:
+    # for the few skills that genuinely need pipes/globs/redirects
     return _s(cmd, shell=True, capture_output=True, text=True).stdout
 
 
+class _Persistent:
+    """Long-lived shell worker: amortizes process startup across calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._p = subprocess.Popen(
+            ["bash"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def run(self, cmd: str) -> str:
+        sentinel = f"__EOF_{uuid.uuid4().hex}__"
+        with self._lock:
+            if self._p.poll() is not None:
+                self.__init__()  # worker died; respawn
+            self._p.stdin.write(f"{cmd}; echo {sentinel}\n")
+            out = []
+            for line in self._p.stdout:
+                if line.rstrip() == sentinel:
+                    break
+                out.append(line)
+            return "".join(out)
+
+
+_SH: Dict[str, _Persistent] = {}
+
+
+def _p(tool: str, cmd: str) -> str:
+    w = _SH.get(tool)
+    if w is None:
+        w = _SH[tool] = _Persistent()
+    return w.run(cmd)
+
+
+# short TTL cache for idempotent read commands: back-to-back calls from
+# an interactive loop skip the whole spawn/roundtrip
+_TTL_CACHE: Dict[Any, tuple] = {}
+
+
+def _ttl(key, ttl, fn):
+    now = time.monotonic()
+    hit = _TTL_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    out = fn()
+    if len(_TTL_CACHE) > 128:
+        for k in [k for k, v in _TTL_CACHE.items() if v[0] <= now]:
+            del _TTL_CACHE[k]
+    _TTL_CACHE[key] = (now + ttl, out)
+    return out
+
+
 def _skill(name: str, desc: str, cat: str = "general", als: List[str] = None):
     def dec(f: Callable):
         cmd = name.replace(" ", "-")
@@ -66,128 +192,178 @@ def _skill(name: str, desc: str, cat: str = "general", als: List[str] = None):
     return dec
 
 
+def _argv_skill(name: str, desc: str, cat: str, prefix: tuple, als: List[str] = None):
+    # specialization for purely-templated handlers: the argv prefix is
+    # baked in once, dispatch is a tuple concat + one subprocess.run
+    def thunk(*a):
+        return _r(list(prefix) + [str(x) for x in a])
+
+    thunk.__name__ = name.replace(" ", "_")
+    _skill(name, desc, cat, als)(thunk)
+    return thunk
+
+
 # Git
 @_skill("git status", "Show git status", "vc")
 def git_status():
-    return _r("git status")
+    return _ttl("git status", 2.0, lambda: _p("git", "git status"))
 
 
 @_skill("git commit", "Commit changes", "vc", ["gc"])
 def git_commit(msg):
-    _r(f"git add . && git commit -m '{msg}'")
+    _r(["git", "add", "."])
+    _r(["git", "commit", "-m", msg])
     return f"Committed: {msg}"
 
 
 @_skill("git push", "Push to remote", "vc")
 def git_push():
-    return _r("git push")
+    return _p("git", "git push")
 
 
 # Docker
 @_skill("docker ps", "List containers", "docker")
 def docker_ps():
-    return _r("docker ps")
+    return _ttl("docker ps", 2.0, lambda: _p("docker", "docker ps"))
 
 
 @_skill("docker exec", "Exec in container", "docker")
 def docker_exec(c, cmd):
-    return _r(f"docker exec {c} {cmd}")
+    return _r(["docker", "exec", c, *shlex.split(cmd)])
 
 
 # System
 @_skill("system info", "System info", "sys", ["si"])
+@functools.cache
 def system_info():
-    import platform
-
+    # uname values are immutable for the process lifetime
     return json.dumps(
         {"os": platform.system(), "ver": platform.version(), "arch": platform.machine()}
     )
 
 
-@_skill("disk usage", "Disk usage", "sys", ["df"])
-def disk_usage():
-    return _r("df -h")
+disk_usage = _argv_skill("disk usage", "Disk usage", "sys", ("df", "-h"), ["df"])
 
 
-@_skill("process list", "Running processes", "sys", ["ps"])
-def process_list():
-    return _r("ps aux")
+process_list = _argv_skill("process list", "Running processes", "sys", ("ps", "aux"), ["ps"])
 
 
 @_skill("kill process", "Kill PID", "sys")
 def kill_process(pid):
-    import signal
-
     os.kill(int(pid), signal.SIGTERM)
     return f"Killed {pid}"
 
 
 # Network
-@_skill("network connections", "Net connections", "net", ["netstat"])
-def network_connections():
-    return _r("netstat -tuln")
+network_connections = _argv_skill(
+    "network connections", "Net connections", "net", ("netstat", "-tuln"), ["netstat"]
+)
 
 
 @_skill("ping", "Ping host", "net")
 def ping(host, count=4):
-    return _r(f"ping -c {count} {host}")
+    return _r(["ping", "-c", str(count), host])
 
 
 # Dev
 @_skill("run python", "Run Python", "dev")
 def run_python(code):
-    p = _s(f"python3 -c '{code}'", shell=True, capture_output=True, text=True)
+    p = _s(["python3", "-c", code], capture_output=True, text=True)
     return p.stdout + p.stderr
 
 
 @_skill("run node", "Run Node", "dev")
 def run_node(code):
-    p = _s(f"node -e '{code}'", shell=True, capture_output=True, text=True)
+    p = _s(["node", "-e", code], capture_output=True, text=True)
     return p.stdout + p.stderr
 
 
-@_skill("npm install", "npm i", "dev")
-def npm_install(pkg):
-    return _r(f"npm install {pkg}")
+npm_install = _argv_skill("npm install", "npm i", "dev", ("npm", "install"))
 
 
-@_skill("pip install", "pip i", "dev")
-def pip_install(pkg):
-    return _r(f"pip install {pkg}")
+pip_install = _argv_skill("pip install", "pip i", "dev", ("pip", "install"))
 
 
 @_skill("start server", "Start dev server", "dev")
 def start_server(cmd):
-    subprocess.Popen(cmd, shell=True)
-    return f"Started: {cmd}"
+    # fire-and-forget: posix_spawnp into its own process group with
+    # stdio on /dev/null - no shell, no Popen bookkeeping kept around
+    argv = shlex.split(cmd)
+    pid = os.posix_spawnp(
+        argv[0],
+        argv,
+        os.environ,
+        setpgroup=0,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ],
+    )
+    return f"Started: {cmd} (pid {pid})"
 
 
 # Files
 @_skill("backup file", "Backup file", "file")
 def backup_file(path):
-    import shutil, datetime
-
     bp = f"{path}.backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    shutil.copy2(path, bp)
+    # sendfile in 8 MiB chunks: ~128x fewer syscalls than copy2's 64K
+    src = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        st = os.fstat(src)
+        dst = os.open(bp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC)
+        try:
+            off = 0
+            while True:
+                sent = os.sendfile(dst, src, off, 8 << 20)
+                if not sent:
+                    break
+                off += sent
+            os.fchmod(dst, st.st_mode)
+        finally:
+            os.close(dst)
+        os.utime(bp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    finally:
+        os.close(src)
     return f"Backed up to {bp}"
 
 
+_SIZE_RX = re.compile(r"(\d+)\s*([KMGT]?)")
+_SIZE_MUL = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def _parse_size(s) -> int:
+    m = _SIZE_RX.match(str(s))
+    return int(m.group(1)) * _SIZE_MUL[m.group(2)] if m else 0
+
+
 @_skill("find large files", "Large files", "file")
 def find_large_files(min="100M", num=10):
-    return _r(
-        f"find . -type f -size +{min} -exec ls -lh {{}} \\; | sort -k5 -h | tail -{num}"
-    )
+    # in-process walk + bounded heap: no find/ls/sort/tail pipeline
+    min_bytes = _parse_size(min)
+    found = []
+    for root, _, files in os.walk(".", followlinks=False):
+        for f in files:
+            p = os.path.join(root, f)
+            try:
+                sz = os.stat(p, follow_symlinks=False).st_size
+            except OSError:
+                continue
+            if sz >= min_bytes:
+                found.append((sz, p))
+    top = heapq.nlargest(int(num), found)
+    return "\n".join(f"{sz}\t{p}" for sz, p in top)
 
 
 @_skill("extract archive", "Extract tar", "file")
 def extract_archive(archive):
-    _r(f"tar -xf {archive}")
+    _r(["tar", "-xf", archive])
     return f"Extracted {archive}"
 
 
 @_skill("create archive", "Create tar", "file")
 def create_archive(name, files):
-    _r(f"tar -czf {name} {' '.join(files)}")
+    _r(["tar", "-czf", name, *files])
     return f"Created {name}"
 
 
@@ -197,76 +373,147 @@ def weather(loc):
     return f"Weather for {loc}: (API not set)"
 
 
+_CALC_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _calc_compile(expr: str):
+    # validate once, compile once; repeated expressions skip both
+    tree = ast.parse(expr, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _CALC_NODES):
+            raise ValueError(f"unsupported: {type(node).__name__}")
+    return compile(tree, "<calc>", "eval")
+
+
 @_skill("calculator", "Calc", "util", ["calc"])
 def calculator(expr):
     try:
-        return str(eval(expr))
+        return str(eval(_calc_compile(expr), {"__builtins__": {}}, {}))
     except Exception as e:
         return f"Error: {e}"
 
 
+_ALPHA = (string.ascii_letters + string.digits).encode()
+_ALPHA_SPEC = _ALPHA + string.punctuation.encode()
+
+
 @_skill("password generate", "Gen password", "util")
 def password_generate(length=16, special=False):
-    import secrets, string
-
-    c = string.ascii_letters + string.digits + (string.punctuation if special else "")
-    return "".join(secrets.choice(c) for _ in range(length))
+    # one bulk RNG draw + rejection sampling instead of a getrandom
+    # syscall per character
+    alphabet = _ALPHA_SPEC if special else _ALPHA
+    n, lim = len(alphabet), 256 - 256 % len(alphabet)
+    out = bytearray()
+    while len(out) < length:
+        out += bytes(
+            alphabet[b % n] for b in secrets.token_bytes(length * 2) if b < lim
+        )
+    return out[: int(length)].decode()
 
 
 @_skill("url encode", "URL enc", "util")
 def url_encode(text):
-    import urllib.parse
-
     return urllib.parse.quote(text)
 
 
 @_skill("url decode", "URL dec", "util")
 def url_decode(text):
-    import urllib.parse
-
     return urllib.parse.unquote(text)
 
 
 # Unrestricted / Admin skills
 @_skill("run anything", "Execute any command", "admin")
 def run_anything(*args):
-    return _r(" ".join(args))
+    return _rsh(" ".join(args))
+
+
+@functools.lru_cache(maxsize=64)
+def _code_compile(code: str, mode: str):
+    return compile(code, "<admin>", mode)
 
 
 @_skill("eval code", "Evaluate Python", "admin", ["py"])
 def eval_code(code):
     try:
-        return str(eval(code))
+        return str(eval(_code_compile(code, "eval")))
     except Exception as e:
         return f"Error: {e}"
 
 
 @_skill("exec code", "Execute Python", "admin")
 def exec_code(code):
-    import sys
-
     g = {"subprocess": subprocess, "os": os, "json": json}
-    exec(code, g)
+    exec(_code_compile(code, "exec"), g)
     return "Executed"
 
 
 @_skill("http request", "Make HTTP", "net")
 def http_request(url, method="GET", data=None):
-    import urllib.request, urllib.parse
-
     d = data.encode() if data else None
     req = urllib.request.Request(url, data=d, method=method)
     with urllib.request.urlopen(req) as r:
-        return r.read().decode()
+        # chunked reads: no full-body bytes+str double allocation
+        buf = bytearray()
+        while chunk := r.read(65536):
+            buf += chunk
+        return buf.decode()
+
+
+def http_json(url, method="GET"):
+    # parse straight off the socket; skips the intermediate str
+    req = urllib.request.Request(url, method=method)
+    with urllib.request.urlopen(req) as r:
+        return json.load(r)
+
+
+def _async_download(urls: List[str], path: str = "/tmp") -> List[str]:
+    # many in-flight connections, 1 MiB chunks: batch fetches pay
+    # max(t_i) instead of serial round-trips
+    import asyncio
+
+    try:
+        import aiohttp
+    except ImportError:
+        for u in urls:
+            urllib.request.urlretrieve(u, f"{path}/{u.split('/')[-1]}")
+        return [f"{path}/{u.split('/')[-1]}" for u in urls]
+
+    async def _fetch(sess, url):
+        dest = f"{path}/{url.split('/')[-1]}"
+        async with sess.get(url) as resp:
+            resp.raise_for_status()
+            with open(dest, "wb") as fh:
+                async for chunk in resp.content.iter_chunked(1 << 20):
+                    fh.write(chunk)
+        return dest
+
+    async def _all():
+        conn = aiohttp.TCPConnector(limit=32)
+        async with aiohttp.ClientSession(connector=conn) as sess:
+            return await asyncio.gather(*(_fetch(sess, u) for u in urls))
+
+    return list(asyncio.run(_all()))
 
 
 @_skill("download file", "Download URL", "net")
 def download_file(url, path="/tmp"):
-    import urllib.request
-
-    fname = url.split("/")[-1]
-    urllib.request.urlretrieve(url, f"{path}/{fname}")
-    return f"Downloaded to {path}/{fname}"
+    dest = _async_download([url], path)[0]
+    return f"Downloaded to {dest}"
 
 
 @_skill("send email", "Send email", "net")
@@ -274,16 +521,38 @@ def send_email(to, subject, body):
     return f"Email would be sent to {to}: {subject}"
 
 
+_SQLITE: Dict[str, Any] = {}  # db path -> pooled connection
+
+
+def _conn(db: str):
+    import sqlite3
+
+    c = _SQLITE.get(db)
+    if c is None:
+        c = sqlite3.connect(db, isolation_level=None, check_same_thread=False)
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        if not _SQLITE:
+            import atexit
+
+            atexit.register(lambda: [x.close() for x in _SQLITE.values()])
+        _SQLITE[db] = c
+    return c
+
+
 @_skill("sqlite query", "Query SQLite", "db")
 def sqlite_query(db_path, query):
-    import sqlite3
+    # pooled connection + fetchmany streaming: peak memory stays
+    # O(chunk) instead of O(rowset) and no second str() megablob
+    import io
 
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute(query)
-    r = c.fetchall()
-    conn.close()
-    return str(r)
+    buf = io.StringIO()
+    cur = _conn(db_path).execute(query)
+    while rows := cur.fetchmany(4096):
+        buf.write("\n".join(map(repr, rows)))
+        buf.write("\n")
+    return buf.getvalue()
 
 
 @_skill("mongo query", "Query Mongo", "db")
@@ -298,15 +567,15 @@ def redis_set(key, value, host="localhost"):
 
 @_skill("docker run", "Run container", "docker")
 def docker_run(image, command=None):
-    cmd = f"docker run -d {image}"
+    argv = ["docker", "run", "-d", image]
     if command:
-        cmd += f" {command}"
-    return _r(cmd)
+        argv += shlex.split(command)
+    return _r(argv)
 
 
 @_skill("docker exec shell", "Shell in container", "docker")
 def docker_exec_shell(container):
-    return _r(f"docker exec -it {container} /bin/sh")
+    return _r(["docker", "exec", "-it", container, "/bin/sh"])
 
 
 @_skill("kubernetes exec", "K8s exec", "k8s")
@@ -320,424 +589,496 @@ def kubernetes_exec(pod, container=None):
 
 @_skill("aws s3 copy", "S3 copy", "cloud")
 def aws_s3_copy(src, dest):
-    return _r(f"aws s3 cp {src} {dest}")
+    return _r(["aws", "s3", "cp", src, dest])
 
 
 @_skill("terraform apply", "Terraform apply", "infra")
 def terraform_apply(plan=None):
-    cmd = "terraform apply"
+    argv = ["terraform", "apply"]
     if plan:
-        cmd += f" -var-file={plan}"
-    return _r(cmd + " -auto-approve")
+        argv.append(f"-var-file={plan}")
+    return _r(argv + ["-auto-approve"])
 
 
 @_skill("ansible playbook", "Run Ansible", "infra")
 def ansible_playbook(playbook, inventory=None):
-    cmd = f"ansible-playbook {playbook}"
+    argv = ["ansible-playbook", playbook]
     if inventory:
-        cmd += f" -i {inventory}"
-    return _r(cmd)
+        argv += ["-i", inventory]
+    return _r(argv)
 
 
 @_skill("git clone", "Clone repo", "vc")
 def git_clone(url, path=None):
-    cmd = f"git clone {url}"
+    argv = ["git", "clone", url]
     if path:
-        cmd += f" {path}"
-    return _r(cmd)
+        argv.append(path)
+    return _r(argv)
 
 
 @_skill("git branch", "List branches", "vc")
 def git_branch():
-    return _r("git branch -a")
+    return _p("git", "git branch -a")
 
 
 @_skill("systemctl", "Systemctl", "sys")
 def systemctl(action, service):
-    return _r(f"sudo systemctl {action} {service}")
+    return _r(["sudo", "systemctl", action, service])
 
 
 @_skill("journalctl", "View logs", "sys")
 def journalctl(service, lines=50):
-    return _r(f"journalctl -u {service} -n {lines}")
+    return _r(["journalctl", "-u", service, "-n", str(lines)])
 
 
 @_skill("lsof port", "Port usage", "net")
 def lsof_port(port):
-    return _r(f"lsof -i :{port}")
-
-
-@_skill("curl json", "Curl JSON API", "net")
-def curl_json(url, method="GET"):
-    return _r(f"curl -s -X {method} {url}")
+    return _r(["lsof", "-i", f":{port}"])
 
 
 @_skill("jq parse", "Parse JSON", "util")
 def jq_parse(json_str, query):
-    return _r(f"echo '{json_str}' | jq '{query}'")
+    # simple dotted paths walk the dict in-process; real jq syntax
+    # still goes to the binary
+    if re.fullmatch(r"\.(\w+(\.\w+)*)?", query):
+        d = json.loads(json_str)
+        for part in query.strip(".").split("."):
+            if part:
+                if not isinstance(d, dict) or part not in d:
+                    return "null"  # jq prints null for absent paths
+                d = d[part]
+        return json.dumps(d, indent=2)
+    return _s(["jq", query], input=json_str, capture_output=True, text=True).stdout
 
 
 @_skill("base64 encode", "Base64 encode", "util")
 def base64_encode(text):
-    import base64
-
     return base64.b64encode(text.encode()).decode()
 
 
 @_skill("base64 decode", "Base64 decode", "util")
 def base64_decode(text):
-    import base64
-
     return base64.b64decode(text.encode()).decode()
 
 
 @_skill("hash brute", "Hash brute force", "util")
 def hash_brute(hash_str, wordlist):
-    return _r(f"hashcat -m 0 {hash_str} {wordlist}")
+    return _r(["hashcat", "-m", "0", hash_str, wordlist])
 
 
 @_skill("nmap scan", "Nmap scan", "net")
 def nmap_scan(target, ports=None):
-    cmd = f"nmap -sV {target}"
+    argv = ["nmap", "-sV", target]
     if ports:
-        cmd += f" -p {ports}"
-    return _r(cmd)
+        argv += ["-p", str(ports)]
+    return _r(argv)
 
 
-@_skill("netcat listen", "Netcat listen", "net")
-def netcat_listen(port):
-    return _r(f"nc -lvp {port}")
+netcat_listen = _argv_skill("netcat listen", "Netcat listen", "net", ("nc", "-lvp"))
 
 
-@_skill("screen create", "Create screen", "sys")
-def screen_create(name):
-    return _r(f"screen -dmS {name}")
+screen_create = _argv_skill("screen create", "Create screen", "sys", ("screen", "-dmS"))
 
 
-@_skill("tmux create", "Create tmux", "sys")
-def tmux_create(name):
-    return _r(f"tmux new -d -s {name}")
+tmux_create = _argv_skill("tmux create", "Create tmux", "sys", ("tmux", "new", "-d", "-s"))
 
 
 @_skill("cron add", "Add cron job", "sys")
 def cron_add(schedule, command):
-    return _r(f'(crontab -l 2>/dev/null; echo "{schedule} {command}") | crontab -')
+    return _rsh(f'(crontab -l 2>/dev/null; echo "{schedule} {command}") | crontab -')
 
 
 @_skill("system info full", "Full system info", "sys")
 def system_info_full():
-    return _r(
-        "echo CPU:$(cat /proc/cpuinfo | grep 'model name' | head -1) RAM:$(free -h | grep Mem) DISK:$(df -h | grep /$)"
-    )
+    cpu, ram, disk = _r_many([["cat", "/proc/cpuinfo"], ["free", "-h"], ["df", "-h"]])
+    model = next((l for l in cpu.splitlines() if "model name" in l), "")
+    mem = next((l for l in ram.splitlines() if l.startswith("Mem")), "")
+    root = next((l for l in disk.splitlines() if l.endswith(" /")), "")
+    return f"CPU:{model} RAM:{mem} DISK:{root}"
 
 
 # DevOps / Cloud
 @_skill("kubectl get pods", "K8s pods", "k8s")
 def k8s_pods(ns="default"):
-    return _r(f"kubectl get pods -n {ns}")
+    return _ttl(
+        ("k8s pods", ns), 2.0, lambda: _p("kubectl", f"kubectl get pods -n {shlex.quote(ns)}")
+    )
 
 
-@_skill("kubectl apply", "K8s apply", "k8s")
-def k8s_apply(f):
-    return _r(f"kubectl apply -f {f}")
+k8s_apply = _argv_skill("kubectl apply", "K8s apply", "k8s", ("kubectl", "apply", "-f"))
 
 
 @_skill("kubectl logs", "K8s logs", "k8s")
 def k8s_logs(pod, ns="default", lines=100):
-    return _r(f"kubectl logs {pod} -n {ns} --tail {lines}")
+    return _p(
+        "kubectl",
+        f"kubectl logs {shlex.quote(pod)} -n {shlex.quote(ns)} --tail {int(lines)}",
+    )
 
 
 @_skill("kubectl describe", "K8s describe", "k8s")
 def k8s_describe(resource, name, ns="default"):
-    return _r(f"kubectl describe {resource} {name} -n {ns}")
+    return _r(["kubectl", "describe", resource, name, "-n", ns])
 
 
 @_skill("helm install", "Helm install", "k8s")
 def helm_install(release, chart, ns="default"):
-    return _r(f"helm install {release} {chart} -n {ns}")
+    return _r(["helm", "install", release, chart, "-n", ns])
 
 
 @_skill("helm list", "Helm list", "k8s")
 def helm_list(ns="default"):
-    return _r(f"helm list -n {ns}")
+    return _p("helm", f"helm list -n {shlex.quote(ns)}")
 
 
-@_skill("terraform init", "Terraform init", "infra")
-def terraform_init():
-    return _r("terraform init")
+terraform_init = _argv_skill("terraform init", "Terraform init", "infra", ("terraform", "init"))
 
 
 @_skill("terraform plan", "Terraform plan", "infra")
 def terraform_plan(var_file=None):
-    cmd = "terraform plan"
+    argv = ["terraform", "plan"]
     if var_file:
-        cmd += f" -var-file={var_file}"
-    return _r(cmd)
+        argv.append(f"-var-file={var_file}")
+    return _r(argv)
 
 
 @_skill("terraform destroy", "Terraform destroy", "infra")
 def terraform_destroy(var_file=None):
-    cmd = "terraform destroy -auto-approve"
+    argv = ["terraform", "destroy", "-auto-approve"]
     if var_file:
-        cmd += f" -var-file={var_file}"
-    return _r(cmd)
+        argv.append(f"-var-file={var_file}")
+    return _r(argv)
 
 
 @_skill("ansible run", "Run Ansible", "infra")
 def ansible_run(playbook, limit=None, tags=None):
-    cmd = f"ansible-playbook {playbook}"
+    argv = ["ansible-playbook", playbook]
     if limit:
-        cmd += f" --limit {limit}"
+        argv += ["--limit", limit]
     if tags:
-        cmd += f" --tags {tags}"
-    return _r(cmd)
+        argv += ["--tags", tags]
+    return _r(argv)
 
 
-@_skill("aws ec2 list", "AWS EC2 list", "cloud")
-def aws_ec2_list():
-    return _r(
-        "aws ec2 describe-instances --query 'Reservations[].Instances[].InstanceId'"
-    )
+aws_ec2_list = _argv_skill(
+    "aws ec2 list",
+    "AWS EC2 list",
+    "cloud",
+    ("aws", "ec2", "describe-instances", "--query", "Reservations[].Instances[].InstanceId"),
+)
 
 
 @_skill("aws s3 ls", "AWS S3 list", "cloud")
 def aws_s3_list(bucket):
-    return _r(f"aws s3 ls s3://{bucket}")
+    return _r(["aws", "s3", "ls", f"s3://{bucket}"])
 
 
 @_skill("aws lambda invoke", "AWS Lambda invoke", "cloud")
 def aws_lambda_invoke(function):
-    return _r(f"aws lambda invoke --function-name {function} /dev/null")
+    return _r(["aws", "lambda", "invoke", "--function-name", function, "/dev/null"])
 
 
 @_skill("gcloud list", "GCP list resources", "cloud")
 def gcloud_list(resource="instances", zone="us-central1-a"):
-    return _r(f"gcloud compute {resource} list --zone {zone}")
+    return _r(["gcloud", "compute", resource, "list", "--zone", zone])
 
 
 @_skill("docker-compose up", "Docker Compose up", "docker")
 def docker_compose_up(d="."):
-    return _r(f"docker-compose up -d")
+    return _r(["docker-compose", "up", "-d"])
 
 
 @_skill("docker-compose down", "Docker Compose down", "docker")
 def docker_compose_down(d="."):
-    return _r(f"docker-compose down")
+    return _r(["docker-compose", "down"])
 
 
 @_skill("docker build", "Docker build", "docker")
 def docker_build(tag, path="."):
-    return _r(f"docker build -t {tag} {path}")
+    return _r(["docker", "build", "-t", tag, path])
 
 
-@_skill("docker push", "Docker push", "docker")
-def docker_push(tag):
-    return _r(f"docker push {tag}")
+docker_push = _argv_skill("docker push", "Docker push", "docker", ("docker", "push"))
 
 
 # Security
 @_skill("nmap scan", "Nmap scan", "security")
 def nmap_scan(target, ports="1-1000", os_detect=False):
-    cmd = f"nmap -sV -p {ports}"
+    argv = ["nmap", "-sV", "-p", str(ports)]
     if os_detect:
-        cmd += " -O"
-    cmd += f" {target}"
-    return _r(cmd)
+        argv.append("-O")
+    argv.append(target)
+    return _r(argv)
 
 
 @_skill("nikto scan", "Nikto scan", "security")
 def nikto_scan(target):
-    return _r(f"nikto -h {target}")
+    return _r(["nikto", "-h", target])
 
 
 @_skill("sqlmap scan", "SQLMap scan", "security")
 def sqlmap_scan(url):
-    return _r(f"sqlmap -u {url} --batch")
+    return _r(["sqlmap", "-u", url, "--batch"])
 
 
 # Monitoring
 @_skill("top processes", "Top processes", "monitor")
 def top_processes(n=10):
-    return _r(f"ps aux --sort=-%cpu | head -{n}")
+    # read /proc/[pid]/stat directly; rank by accumulated cpu ticks
+    procs = []
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat") as fh:
+                st = fh.read()
+        except OSError:
+            continue
+        # comm may contain spaces; fields after the closing paren are fixed
+        name = st[st.index("(") + 1 : st.rindex(")")]
+        f = st[st.rindex(")") + 2 :].split()
+        procs.append((int(f[11]) + int(f[12]), pid, name))  # utime + stime
+    top = heapq.nlargest(int(n), procs)
+    return "\n".join(f"{pid}\t{ticks}\t{name}" for ticks, pid, name in top)
 
 
 @_skill("memory usage", "Memory usage", "monitor")
 def memory_usage():
-    return _r("free -h && vmstat 1 3")
+    return "\n".join(_r_many([["free", "-h"], ["vmstat", "1", "3"]]))
 
 
 @_skill("disk io", "Disk I/O", "monitor")
 def disk_io():
-    return _r("iostat -x 1 3")
+    return _r(["iostat", "-x", "1", "3"])
 
 
 @_skill("network stats", "Network stats", "monitor")
 def network_stats():
-    return _r("netstat -s && ss -s")
+    return "\n".join(_r_many([["netstat", "-s"], ["ss", "-s"]]))
 
 
 @_skill("tail logs", "Tail logs", "monitor")
 def tail_logs(path, lines=50):
-    return _r(f"tail -{lines} {path}")
+    return _r(["tail", f"-{lines}", path])
 
 
 @_skill("grep logs", "Grep logs", "monitor")
-def grep_logs(pattern, path="/var/log/*.log"):
-    return _r(f"grep -r '{pattern}' {path} | head -50")
+def grep_logs(pattern, path="/var/log/*.log", limit=50):
+    # in-process: compile once, stream each file, stop at the limit
+    rx = re.compile(pattern)
+    out = []
+    for fp in glob.glob(path, recursive=True):
+        try:
+            with open(fp, errors="replace") as fh:
+                for line in fh:
+                    if rx.search(line):
+                        out.append(f"{fp}:{line.rstrip()}")
+                        if len(out) >= limit:
+                            return "\n".join(out)
+        except OSError:
+            continue
+    return "\n".join(out)
 
 
 # Database
 @_skill("mysql query", "MySQL query", "db")
 def mysql_query(query, db="mysql"):
-    return _r(f"mysql -e '{query}' {db}")
+    return _r(["mysql", "-e", query, db])
 
 
 @_skill("postgres query", "PostgreSQL query", "db")
 def postgres_query(query, db="postgres"):
-    return _r(f"psql -c '{query}' {db}")
+    return _r(["psql", "-c", query, db])
 
 
 @_skill("redis keys", "Redis keys", "db")
 def redis_keys(pattern="*"):
-    return _r(f"redis-cli KEYS '{pattern}'")
+    return _r(["redis-cli", "KEYS", pattern])
 
 
 @_skill("mongo find", "MongoDB find", "db")
 def mongo_find(collection, db="test", query="{}"):
-    return _r(f"mongo {db} --quiet --eval 'db.{collection}.find({query}).pretty()'")
+    return _r(
+        ["mongo", db, "--quiet", "--eval", f"db.{collection}.find({query}).pretty()"]
+    )
 
 
 # Text Processing
 @_skill("json format", "Format JSON", "text")
 def json_format(file):
-    return _r(f"python3 -m json.tool {file}")
+    with open(file) as fh:
+        return json.dumps(json.load(fh), indent=2)
 
 
 @_skill("yaml to json", "YAML to JSON", "text")
 def yaml_to_json(file):
-    return _r(
-        f"python3 -c 'import json,yaml; print(json.dumps(yaml.safe_load(open(\"{file}\"))))'"
-    )
+    import yaml
+
+    with open(file) as fh:
+        return json.dumps(yaml.safe_load(fh))
 
 
 @_skill("csv to json", "CSV to JSON", "text")
 def csv_to_json(file):
-    return _r(
-        f"python3 -c 'import csv,json; print(json.dumps(list(csv.DictReader(open(\"{file}\")))))'"
-    )
+    import csv
+
+    with open(file) as fh:
+        return json.dumps(list(csv.DictReader(fh)))
 
 
 @_skill("sort lines", "Sort lines", "text")
 def sort_lines(file, unique=False):
-    cmd = f"sort {file}"
+    argv = ["sort", file]
     if unique:
-        cmd += " | uniq"
-    return _r(cmd)
+        argv.append("-u")
+    return _r(argv)
 
 
 # Network
-@_skill("curl headers", "Get HTTP headers", "net")
-def curl_headers(url):
-    return _r(f"curl -I {url}")
+curl_headers = _argv_skill("curl headers", "Get HTTP headers", "net", ("curl", "-I"))
 
 
 @_skill("curl json", "Get JSON", "net")
 def curl_json(url):
-    return _r(f"curl -s {url} | python3 -m json.tool")
+    # in-process fetch + pretty-print: was a curl|json.tool double fork
+    return json.dumps(http_json(url), indent=2)
 
 
 @_skill("wget download", "Wget download", "net")
 def wget_download(url, out="/tmp"):
-    return _r(f"wget -P {out} {url}")
+    return _r(["wget", "-P", out, url])
 
 
 @_skill("ssh copy id", "SSH copy key", "net")
 def ssh_copy_id(user, host):
-    return _r(f"ssh-copy-id {user}@{host}")
+    return _r(["ssh-copy-id", f"{user}@{host}"])
 
 
 # File Management
+def _fs_find(root=".", name=None, min_size=None, max_age_days=None):
+    # one fused walk instead of one find(1) subprocess per predicate;
+    # cheapest check (name) runs first, stat only when needed
+    import fnmatch
+
+    cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+    out = []
+    for d, _, files in os.walk(root, followlinks=False):
+        for f in files:
+            if name and not fnmatch.fnmatchcase(f, name):
+                continue
+            p = os.path.join(d, f)
+            if min_size is not None or cutoff is not None:
+                try:
+                    st = os.stat(p, follow_symlinks=False)
+                except OSError:
+                    continue
+                if min_size is not None and st.st_size < min_size:
+                    continue
+                if cutoff is not None and st.st_mtime < cutoff:
+                    continue
+            out.append(p)
+    return "\n".join(out)
+
+
 @_skill("find by name", "Find by name", "file")
 def find_by_name(pattern, path="."):
-    return _r(f"find {path} -name '{pattern}'")
+    return _fs_find(path, name=pattern)
 
 
 @_skill("find by size", "Find by size", "file")
 def find_by_size(size="+100M", path="."):
-    return _r(f"find {path} -size {size}")
+    return _fs_find(path, min_size=_parse_size(size.lstrip("+")))
 
 
 @_skill("find by time", "Find by time", "file")
 def find_by_time(days=7, path="."):
-    return _r(f"find {path} -mtime -{days}")
+    return _fs_find(path, max_age_days=float(days))
 
 
 @_skill("chmod recursive", "Chmod recursive", "file")
 def chmod_recursive(mode, path="."):
-    return _r(f"chmod -R {mode} {path}")
+    return _r(["chmod", "-R", str(mode), path])
 
 
 @_skill("chown recursive", "Chown recursive", "file")
 def chown_recursive(user, path="."):
-    return _r(f"chown -R {user} {path}")
+    return _r(["chown", "-R", user, path])
 
 
 @_skill("rsync copy", "Rsync copy", "file")
 def rsync_copy(src, dest, archive=True):
-    cmd = "rsync -avz" if archive else "rsync -vz"
-    return _r(f"{cmd} {src} {dest}")
+    flags = "-avz" if archive else "-vz"
+    return _r(["rsync", flags, src, dest])
 
 
 # System
-@_skill("check ports", "Check listening ports", "sys")
-def check_ports():
-    return _r("ss -tulpn")
+check_ports = _argv_skill("check ports", "Check listening ports", "sys", ("ss", "-tulpn"))
 
 
-@_skill("user list", "List users", "sys")
-def user_list():
-    return _r("cat /etc/passwd | cut -d: -1")
+user_list = _argv_skill("user list", "List users", "sys", ("cut", "-d:", "-f1", "/etc/passwd"))
 
 
 @_skill("service status", "Service status", "sys")
 def service_status(name):
-    return _r(f"systemctl status {name} || service {name} status")
+    return _rsh(f"systemctl status {name} || service {name} status")
 
 
 @_skill("restart service", "Restart service", "sys")
 def restart_service(name):
-    return _r(f"sudo systemctl restart {name} && sudo systemctl status {name}")
+    return _rsh(f"sudo systemctl restart {name} && sudo systemctl status {name}")
 
 
-@_skill("reload daemon", "Reload systemd", "sys")
-def reload_daemon():
-    return _r("sudo systemctl daemon-reload")
+reload_daemon = _argv_skill(
+    "reload daemon", "Reload systemd", "sys", ("sudo", "systemctl", "daemon-reload")
+)
 
 
-@_skill("fail2ban status", "Fail2ban status", "security")
-def fail2ban_status():
-    return _r("sudo fail2ban-client status")
+fail2ban_status = _argv_skill(
+    "fail2ban status", "Fail2ban status", "security", ("sudo", "fail2ban-client", "status")
+)
 
 
-@_skill("ufw status", "UFW firewall status", "security")
-def ufw_status():
-    return _r("sudo ufw status numbered")
+ufw_status = _argv_skill(
+    "ufw status", "UFW firewall status", "security", ("sudo", "ufw", "status", "numbered")
+)
 
 
-@_skill("iptables list", "IPTables rules", "security")
-def iptables_list():
-    return _r("sudo iptables -L -n -v")
+iptables_list = _argv_skill(
+    "iptables list", "IPTables rules", "security", ("sudo", "iptables", "-L", "-n", "-v")
+)
 
 
 # Containers
-@_skill("podman ps", "Podman containers", "container")
-def podman_ps():
-    return _r("podman ps -a")
+podman_ps = _argv_skill("podman ps", "Podman containers", "container", ("podman", "ps", "-a"))
+
+
+crictl_pods = _argv_skill("crictl pods", "CRI-O pods", "container", ("crictl", "pods"))
 
 
-@_skill("crictl pods", "CRI-O pods", "container")
-def crictl_pods():
-    return _r("crictl pods")
+async def run_skills(calls) -> List[Any]:
+    """Run several skills concurrently; calls is [(name, args...), ...].
+
+    Independent subprocess-backed skills overlap their fork/exec and
+    wait, so a composite flow pays max(t_i) instead of the sum.
+
+    Handlers run on the loop's default executor, NOT _POOL: handlers
+    like memory_usage fan out through _r_many, which blocks on _POOL,
+    and sharing it would deadlock once the workers fill up.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+
+    def _one(call):
+        name, *args = call if isinstance(call, (list, tuple)) else (call,)
+        sk = R.get(name)
+        if sk is None or not sk.enabled:
+            return f"Unknown skill: {name}"
+        return sk.handler(*args)
+
+    return list(
+        await asyncio.gather(*(loop.run_in_executor(None, _one, c) for c in calls))
+    )
 
 
 def get_skill(n: str) -> Optional[Skill]:
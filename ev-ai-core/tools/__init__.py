@@ -1,5 +1,5 @@
 # v2026-02-efficient-r1 - Tools library
-import subprocess, os, json, re, hashlib, base64, yaml, csv, xml.etree.ElementTree as ET
+import asyncio, functools, subprocess, os, json, re, hashlib, base64
 from pathlib import Path
 from typing import Any, Dict, List
 from datetime import datetime, timedelta
@@ -12,7 +12,8 @@ class ToolRegistry:
         self.tools = {}
 
     def reg(self, n: str, f: callable, d: str = ""):
-        self.tools[n] = (f, d)
+        # coroutine check done once here, not on every dispatch
+        self.tools[n] = (f, d, asyncio.iscoroutinefunction(f))
 
     def exec(self, n: str, **kw):
         return self.tools[n][0](**kw)
@@ -45,29 +46,77 @@ def write(p: str, c: str, enc: str = "utf-8") -> str:
     return f"Written to {p}"
 
 
+def read_many(paths: List[str], enc: str = "utf-8") -> Dict[str, str]:
+    # batch the blocking reads across threads; the kernel overlaps the
+    # underlying I/O so a cold-cache batch costs ~max(t_i), not the sum
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _one(p):
+        try:
+            return read(p, enc)
+        except OSError as e:
+            return f"ERROR: {e}"
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), 32) or 1) as ex:
+        return dict(zip(paths, ex.map(_one, paths)))
+
+
 def exists(p: str) -> bool:
     return os.path.exists(p)
 
 
 def glob(pat: str = "*", path: str = ".") -> List[str]:
+    # scandir walk + one precompiled fnmatch regex: no per-file
+    # fnmatch call, no stat for non-matches
     import fnmatch
 
-    return [
-        os.path.join(root, f)
-        for root, _, files in os.walk(path)
-        for f in files
-        if fnmatch.fnmatch(f, pat)
-    ]
+    cre = _pat(fnmatch.translate(pat))
+    out = []
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for e in entries:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif cre.match(e.name):
+                    out.append(e.path)
+    return out
+
+
+@functools.lru_cache(maxsize=256)
+def _pat(p: str, f: int = 0):
+    return re.compile(p, f)
 
 
 def grep(pat: str, path: str, ctx: int = 2) -> List[str]:
+    # streaming ring buffer: O(ctx) memory instead of readlines()'
+    # O(filesize), same "Line N: <context>" output
+    from collections import deque
+
+    cre = _pat(pat)
+    window = deque(maxlen=ctx + 1)  # match line + ctx before it
+    out: List[str] = []
+    pending: List[list] = []  # [lineno, parts, after-lines still needed]
     with open(path) as f:
-        lines = f.readlines()
-    return [
-        f"Line {i + 1}: {''.join(lines[max(0, i - ctx) : min(len(lines), i + ctx + 1)])}"
-        for i, line in enumerate(lines)
-        if re.search(pat, line)
-    ]
+        for i, line in enumerate(f):
+            window.append(line)
+            for p in pending:
+                p[1].append(line)
+                p[2] -= 1
+            if cre.search(line):
+                pending.append([i + 1, list(window), ctx])
+            # flush after the append so a ctx=0 match completes on its
+            # own line instead of collecting one stray after-line
+            while pending and pending[0][2] <= 0:
+                n, parts, _ = pending.pop(0)
+                out.append(f"Line {n}: {''.join(parts)}")
+    for n, parts, _ in pending:
+        out.append(f"Line {n}: {''.join(parts)}")
+    return out
 
 
 def file_info(p: str) -> Dict:
@@ -82,8 +131,18 @@ def file_info(p: str) -> Dict:
     }
 
 
-_jd = json.dumps
-_jl = json.loads
+try:  # SIMD-accelerated parse/encode when available
+    import orjson
+
+    _jl = orjson.loads
+
+    def _jd(o, indent=None):
+        opt = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(o, option=opt).decode()
+
+except ImportError:
+    _jd = json.dumps
+    _jl = json.loads
 
 
 def json_parse(c: str) -> Any:
@@ -94,15 +153,37 @@ def json_create(o: Any, ind: int = 2) -> str:
     return _jd(o, indent=ind)
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    # deferred: yaml costs ~20ms of import that most CLI runs never use.
+    # libyaml C parser when available, 20-50x over the pure-Python path.
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as L, CSafeDumper as D
+    except ImportError:
+        import warnings
+
+        warnings.warn(
+            "libyaml not available; YAML parsing uses the slow pure-Python path"
+        )
+        from yaml import SafeLoader as L, SafeDumper as D
+    return yaml, L, D
+
+
 def yaml_parse(c: str) -> Any:
-    return yaml.safe_load(c)
+    y, L, _ = _yaml()
+    return y.load(c, Loader=L)
 
 
 def yaml_create(o: Any) -> str:
-    return yaml.dump(o)
+    y, _, D = _yaml()
+    return y.dump(o, Dumper=D)
 
 
 def csv_read(p: str) -> List[Dict]:
+    import csv
+
     with open(p) as f:
         return list(csv.DictReader(f))
 
@@ -110,49 +191,95 @@ def csv_read(p: str) -> List[Dict]:
 def csv_write(p: str, data: List[Dict], fn: List[str] = None):
     if not data:
         return "No data"
+    import csv
+
     fn = fn or list(data[0].keys())
-    with open(p, "w", newline="") as f:
-        csv.DictWriter(f, fieldnames=fn).writeheader()
-        csv.DictWriter(f, fieldnames=fn).writerows(data)
+    with open(p, "w", newline="", buffering=1 << 20) as f:
+        w = csv.DictWriter(f, fieldnames=fn)
+        w.writeheader()
+        w.writerows(data)
     return f"Written {len(data)} rows"
 
 
-def xml_parse(c: str) -> ET.Element:
+def xml_parse(c: str) -> Any:
+    import xml.etree.ElementTree as ET
+
     return ET.fromstring(c)
 
 
 def xml_create(root: str, d: Dict) -> str:
+    import xml.etree.ElementTree as ET
+
     r = ET.Element(root)
     for k, v in d.items():
         ET.SubElement(r, k).text = str(v)
     return ET.tostring(r, encoding="unicode")
 
 
+# keep-alive connection pool: repeat calls to one host skip the
+# TCP+TLS handshake (urllib.request opened a fresh connection per call)
+_HTTP_POOL: Dict[tuple, Any] = {}
+
+
+def _http_conn(scheme: str, host: str):
+    import http.client
+
+    key = (scheme, host)
+    c = _HTTP_POOL.get(key)
+    if c is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        c = _HTTP_POOL[key] = cls(host, timeout=30)
+    return c
+
+
 def http(url: str, method: str = "GET", hdrs: Dict = None, data: Any = None) -> Dict:
-    import urllib.request, urllib.error
+    import urllib.parse
 
-    req = urllib.request.Request(url, method=method)
-    [req.add_header(k, v) for k, v in (hdrs or {}).items()]
+    u = urllib.parse.urlsplit(url)
+    body = None
     if data:
-        req.data = (
-            json.dumps(data).encode() if isinstance(data, dict) else data.encode()
-        )
-    try:
-        with urllib.request.urlopen(req) as resp:
+        body = json.dumps(data).encode() if isinstance(data, dict) else data.encode()
+    target = urllib.parse.urlunsplit(("", "", u.path or "/", u.query, ""))
+    for attempt in (0, 1):  # stale keep-alive connection gets one retry
+        conn = _http_conn(u.scheme, u.netloc)
+        try:
+            conn.request(method, target, body=body, headers=hdrs or {})
+            resp = conn.getresponse()
             return {
                 "s": resp.status,
                 "h": dict(resp.headers),
                 "b": resp.read().decode(),
             }
-    except urllib.error.HTTPError as e:
-        return {"s": e.code, "e": str(e)}
+        except (ConnectionError, OSError) as e:
+            _HTTP_POOL.pop((u.scheme, u.netloc), None)
+            conn.close()
+            if attempt:
+                return {"s": 0, "e": str(e)}
 
 
 _algs = {"md5": hashlib.md5, "sha1": hashlib.sha1, "sha256": hashlib.sha256}
 
 
-def hash(c: str, alg: str = "sha256") -> str:
-    return _algs.get(alg, hashlib.sha256)(c.encode()).hexdigest()
+def hash(c, alg: str = "sha256") -> str:
+    # bytes input skips the encode copy
+    b = c if isinstance(c, (bytes, bytearray, memoryview)) else c.encode()
+    return _algs.get(alg, hashlib.sha256)(b).hexdigest()
+
+
+def hash_file(path: str, algorithm: str = "sha256") -> str:
+    # signature kept aligned with ADVANCED_TOOLS['hash_file'] so callers
+    # can swap between them, but the agent never merges this registry -
+    # agent.execute("hash_file ...") dispatches to the async mcp version.
+    # One mmap update lets OpenSSL consume blocks straight from page cache
+    h = hashlib.new(algorithm)
+    import mmap
+
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mv:
+                h.update(mv)
+    return h.hexdigest()
 
 
 def b64e(c: str) -> str:
@@ -164,17 +291,24 @@ def b64d(c: str) -> str:
 
 
 def re_match(pat: str, c: str, f: int = 0) -> List[str]:
-    return re.findall(pat, c, f)
+    return _pat(pat, f).findall(c)
 
 
 def re_replace(pat: str, c: str, repl: str, f: int = 0) -> str:
-    return re.sub(pat, repl, c, flags=f)
+    return _pat(pat, f).sub(repl, c)
 
 
 def ts_now() -> str:
     return datetime.now().isoformat()
 
 
+def ts_ns() -> int:
+    # one clock_gettime, no datetime object or string formatting
+    import time
+
+    return time.time_ns()
+
+
 def ts_parse(s: str) -> datetime:
     return datetime.fromisoformat(s)
 
@@ -194,33 +328,82 @@ def env_set(k: str, v: str):
     return f"Set {k}"
 
 
+# in-process desktop bindings when installed: no fork per call.
+# Each falls back to the argv-spawned CLI tool.
+try:
+    import pyperclip as _clip  # single persistent X connection
+except ImportError:
+    _clip = None
+
+try:
+    import mss as _mss  # XShm screenshots, no scrot spawn
+except ImportError:
+    _mss = None
+
+try:
+    import gi as _gi
+
+    _gi.require_version("Notify", "0.7")
+    from gi.repository import Notify as _Notify
+
+    _Notify.init("ev-ai")
+except (ImportError, ValueError):
+    _Notify = None
+
+
 def clip_get() -> str:
-    return _b(
-        "xclip -selection clipboard -o", shell=True, capture_output=True, text=True
-    ).stdout
+    if _clip:
+        return _clip.paste()
+    try:
+        return _b(
+            ["xclip", "-selection", "clipboard", "-o"], capture_output=True, text=True
+        ).stdout
+    except FileNotFoundError:
+        return ""
 
 
 def clip_set(c: str):
-    _b(f"echo '{c}' | xclip -selection clipboard", shell=True)
-    return "Copied"
+    if _clip:
+        _clip.copy(c)
+        return "Copied"
+    try:
+        _b(["xclip", "-selection", "clipboard"], input=c.encode(), check=False)
+        return "Copied"
+    except FileNotFoundError:
+        return "ERROR: no clipboard backend"
 
 
 def screenshot(p: str = None):
     if not p:
-        p = f"/tmp/screenshot_{ts_now()}.png"
-    _b(f"scrot {p}", shell=True)
+        # time_ns: cheap and has no colons to upset the filesystem
+        p = f"/tmp/screenshot_{ts_ns()}.png"
+    if _mss:
+        with _mss.mss() as s:
+            s.shot(output=p)
+    else:
+        try:
+            _b(["scrot", p])
+        except FileNotFoundError:
+            return "ERROR: no screenshot backend"
     return f"Saved to {p}"
 
 
 def notify(t: str, m: str):
-    _b(f"notify-send '{t}' '{m}'", shell=True)
-    return "Sent"
+    if _Notify:
+        _Notify.Notification.new(t, m).show()
+        return "Sent"
+    try:
+        _b(["notify-send", t, m])
+        return "Sent"
+    except FileNotFoundError:
+        return "ERROR: no notify backend"
 
 
 # Register all
 for n, f, d in [
     ("bash", bash, "Run bash"),
     ("read", read, "Read file"),
+    ("read_many", read_many, "Read files"),
     ("write", write, "Write file"),
     ("exists", exists, "Check exists"),
     ("glob", glob, "Find files"),
@@ -236,11 +419,13 @@ for n, f, d in [
     ("xml_create", xml_create, "Create XML"),
     ("http", http, "HTTP req"),
     ("hash", hash, "Hash"),
+    ("hash_file", hash_file, "Hash file"),
     ("b64e", b64e, "Base64 enc"),
     ("b64d", b64d, "Base64 dec"),
     ("re_match", re_match, "Regex match"),
     ("re_replace", re_replace, "Regex replace"),
     ("ts", ts_now, "Timestamp"),
+    ("ts_ns", ts_ns, "Timestamp ns"),
     ("ts_add", ts_add, "Add time"),
     ("env_get", env_get, "Get env"),
     ("env_set", env_set, "Set env"),
@@ -252,3 +437,12 @@ for n, f, d in [
     r.reg(n, f, d)
 
 exec_tool = r.exec
+
+
+async def execute_tool_async(n: str, **kw):
+    # async mirror of exec_tool: coroutines run on the loop directly,
+    # blocking calls are offloaded so several invocations can overlap
+    f, _, is_coro = r.tools[n]
+    if is_coro:
+        return await f(**kw)
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: f(**kw))
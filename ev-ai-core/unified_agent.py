@@ -12,9 +12,18 @@ import os
 import subprocess
 import sqlite3
 import re
+import threading
 from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl
+
+try:
+    import uvloop
+
+    uvloop.install()  # ~2x event-loop throughput; handlers unchanged
+except ImportError:
+    pass
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 if _script_dir not in sys.path:
@@ -37,6 +46,20 @@ from proactive import pe as proactive_engine, trigger_action, analyze_and_act
 from mcp.advanced import ADVANCED_TOOLS
 from mcp.extended import EXTENDED_TOOLS
 
+# compiled once: "name key='value' ..." command parsing on the dispatch path
+_CMD_RE = re.compile(r"^(\w+)\s+(.+)$")
+_PARAM_RE = re.compile(r"(\w+)=(['\"]?)(.+?)\2(?:\s|$)")
+
+# repeated prompts skip the model run entirely
+_AI_CACHE: Dict[str, str] = {}
+
+try:
+    import orjson
+
+    _loads = orjson.loads  # 2-5x stdlib on webhook-sized bodies
+except ImportError:
+    _loads = json.loads
+
 
 class UnifiedAgent:
     """Unrestricted unified agent with full ecosystem access"""
@@ -51,6 +74,17 @@ class UnifiedAgent:
         self.running = True
         self.context = {}
         self._load_tools()
+        self._index_skills()
+        self._bg_loop = None  # started on first execute_sync from async code
+        self._bg_lock = threading.Lock()
+        # tool name lists never change after _load_tools: freeze them once
+        self._caps_static = {
+            "name": self.name,
+            "version": self.version,
+            "advanced_tools": list(ADVANCED_TOOLS.keys()),
+            "extended_tools": list(EXTENDED_TOOLS.keys()),
+            "memory_categories": ["general", "interaction", "pattern", "skill"],
+        }
 
     def _load_tools(self):
         """Load all available tools"""
@@ -58,82 +92,120 @@ class UnifiedAgent:
             self.tools.reg(name, func, func.__doc__ or "")
         for name, func in EXTENDED_TOOLS.items():
             self.tools.reg(name, func, func.__doc__ or "")
+        # one lowercased table with iscoroutinefunction precomputed, so
+        # dispatch is a single dict get instead of three scans per call
+        self._dispatch: Dict[str, tuple] = {}
+        for src in (ADVANCED_TOOLS, EXTENDED_TOOLS):
+            for name, func in src.items():
+                self._dispatch[name.lower()] = (func, asyncio.iscoroutinefunction(func))
+        for name, entry in self.tools.tools.items():
+            func = entry[0]
+            self._dispatch[name.lower()] = (func, asyncio.iscoroutinefunction(func))
+
+    def _index_skills(self):
+        """(Re)build the lowercase skill lookup tables used by execute"""
+        # exact match: lowercased name -> registered name
+        self._skill_index = {s["n"].lower(): s["n"] for s in list_skills()}
+        # prefix match: first word -> candidates, longest name first so
+        # "git log graph" wins over "git log"
+        by_word: Dict[str, list] = {}
+        for low, name in self._skill_index.items():
+            by_word.setdefault(low.split(" ", 1)[0], []).append((low, name))
+        for cands in by_word.values():
+            cands.sort(key=lambda c: len(c[0]), reverse=True)
+        self._skill_by_word = by_word
+
+    def _bg(self):
+        """Long-lived event loop on a daemon thread for sync-from-async calls"""
+        if self._bg_loop is None:
+            with self._bg_lock:
+                if self._bg_loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, daemon=True, name="agent-bg-loop"
+                    ).start()
+                    self._bg_loop = loop
+        return self._bg_loop
 
     def execute_sync(self, command: str, **kwargs) -> Any:
         """Synchronous execution wrapper"""
-        try:
-            loop = asyncio.get_running_loop()
-            # We're in an async context, create a task
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, self.execute(command, **kwargs))
-                return future.result()
-        except RuntimeError:
-            # No running loop, we can use asyncio.run
+        # None-returning probe: no RuntimeError raised/caught per call
+        if asyncio._get_running_loop() is None:
             return asyncio.run(self.execute(command, **kwargs))
+        # In an async context: hand off to the persistent background loop
+        # instead of bootstrapping a fresh executor + loop per call
+        fut = asyncio.run_coroutine_threadsafe(
+            self.execute(command, **kwargs), self._bg()
+        )
+        return fut.result()
 
     async def execute(self, command: str, **kwargs) -> Any:
         """Execute any command with full ecosystem access"""
         # First check skills (multi-word names supported) before any parsing
-        for skill_name in list_skills():
-            if command.lower().strip() == skill_name["n"].lower():
-                s = get_skill(skill_name["n"])
+        cl = command.lower().strip()
+        name = self._skill_index.get(cl)
+        if name:
+            s = get_skill(name)
+            if s and s.enabled:
+                return s.handler(**kwargs)
+        for low, name in self._skill_by_word.get(cl.split(" ", 1)[0], ()):
+            # word boundary: "calc 1+1" must not fire the "calculator" skill
+            if cl.startswith(low) and (len(cl) == len(low) or cl[len(low)] == " "):
+                s = get_skill(name)
                 if s and s.enabled:
-                    return s.handler(**kwargs)
-            if command.lower().strip().startswith(skill_name["n"].lower()):
-                s = get_skill(skill_name["n"])
-                if s and s.enabled:
-                    remaining = command[len(skill_name["n"]) :].strip()
+                    remaining = command[len(low) :].strip()
                     if remaining:
                         return s.handler(remaining)
                     return s.handler(**kwargs)
 
         # Parse command with params like "shell_exec cmd='whoami'"
-        import re
-
-        param_match = re.match(r"^(\w+)\s+(.+)$", command)
+        param_match = _CMD_RE.match(command)
         if param_match:
             cmd_name = param_match.group(1).lower()
             param_str = param_match.group(2)
-            param_matches = re.findall(r"(\w+)=(['\"]?)(.+?)\2(?:\s|$)", param_str)
+            param_matches = _PARAM_RE.findall(param_str)
             for k, _, v in param_matches:
                 kwargs[k] = v
             command = cmd_name
 
         cmd_lower = command.lower().strip()
 
-        if cmd_lower in self.tools.tools:
-            func = self.tools.tools[cmd_lower][0]
-            if asyncio.iscoroutinefunction(func):
+        entry = self._dispatch.get(cmd_lower)
+        if entry:
+            func, is_coro = entry
+            if is_coro:
                 return await func(**kwargs)
             return func(**kwargs)
 
-        for name, func in ADVANCED_TOOLS.items():
-            if cmd_lower == name.lower():
-                if asyncio.iscoroutinefunction(func):
-                    return await func(**kwargs)
-                return func(**kwargs)
-
-        for name, func in EXTENDED_TOOLS.items():
-            if cmd_lower == name.lower():
-                if asyncio.iscoroutinefunction(func):
-                    return await func(**kwargs)
-                return func(**kwargs)
-
         return await self._ai_execute(command, **kwargs)
 
     async def _ai_execute(self, command: str, **kwargs) -> Any:
         """Fallback AI execution via local model"""
+        cached = _AI_CACHE.get(command)
+        if cached is not None:
+            return cached
         try:
-            result = subprocess.run(
-                f'ollama run llama3.1:70b "{command}"',
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=60,
+            # argv exec, no shell: doesn't block the loop during the model run
+            proc = await asyncio.create_subprocess_exec(
+                "ollama",
+                "run",
+                "llama3.1:70b",
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            return result.stdout.strip()
+            try:
+                out, _ = await asyncio.wait_for(proc.communicate(), timeout=60)
+            except TimeoutError:
+                # wait_for only cancels the wait; reap the model process
+                proc.kill()
+                await proc.wait()
+                return f"Command not found: {command}"
+            result = out.decode().strip()
+            if len(_AI_CACHE) >= 512:  # crude LRU: evict oldest insertion
+                _AI_CACHE.pop(next(iter(_AI_CACHE)))
+            _AI_CACHE[command] = result
+            return result
         except:
             return f"Command not found: {command}"
 
@@ -167,10 +239,11 @@ class UnifiedAgent:
     def register_tool(self, name: str, func: Callable, desc: str = ""):
         """Register custom tool"""
         self.tools.reg(name, func, desc)
+        self._dispatch[name.lower()] = (func, asyncio.iscoroutinefunction(func))
 
     def register_skill(self, name: str, desc: str, cat: str, handler: Callable):
         """Register custom skill"""
-        self.skills.reg(
+        self.skills_registry.reg(
             Skill(
                 name=name,
                 desc=desc,
@@ -179,6 +252,7 @@ class UnifiedAgent:
                 handler=handler,
             )
         )
+        self._index_skills()
 
     async def start_http_server(self, port: int = 8080):
         """Start HTTP API server with GitHub webhook support"""
@@ -189,7 +263,7 @@ class UnifiedAgent:
 
         @server.route("/agent/execute", "POST")
         def execute_handler(body):
-            data = json.loads(body) if body else {}
+            data = _loads(body) if body else {}
             result = agent.execute_sync(
                 data.get("command", ""), **data.get("params", {})
             )
@@ -197,7 +271,7 @@ class UnifiedAgent:
 
         @server.route("/agent/memory/store", "POST")
         def memory_store_handler(body):
-            data = json.loads(body) if body else {}
+            data = _loads(body) if body else {}
             self.memory.store(
                 data.get("key"), data.get("value"), data.get("category", "general")
             )
@@ -205,10 +279,8 @@ class UnifiedAgent:
 
         @server.route("/agent/memory/recall", "GET")
         def memory_recall_handler(path):
-            from urllib.parse import parse_qs
-
-            params = parse_qs(path)
-            key = params.get("key", [None])[0]
+            q = dict(parse_qsl(urlsplit(path).query))
+            key = q.get("key")
             return {"result": self.memory.recall(key) if key else None}
 
         @server.route("/agent/skills", "GET")
@@ -222,37 +294,39 @@ class UnifiedAgent:
         @server.route("/github/webhook", "POST")
         def github_webhook_handler(body):
             try:
-                data = json.loads(body) if body else {}
+                data = _loads(body) if body else {}
                 event = os.environ.get("GITHUB_EVENT", "push")
 
-                if data.get("commits"):
-                    for commit in data.get("commits", []):
-                        msg = commit.get("message", "")
-                        self.memory.store(
-                            f"github_commit_{commit.get('id', '')}", msg, "github"
-                        )
-
+                # collect everything, write in one transaction
+                items = [
+                    (
+                        f"github_commit_{commit.get('id', '')}",
+                        commit.get("message", ""),
+                        "github",
+                    )
+                    for commit in data.get("commits") or []
+                ]
                 if data.get("issue"):
                     issue = data.get("issue", {})
-                    self.memory.store(
-                        f"github_issue_{issue.get('number', '')}",
-                        issue.get("title"),
-                        "github",
+                    items.append(
+                        (
+                            f"github_issue_{issue.get('number', '')}",
+                            issue.get("title"),
+                            "github",
+                        )
                     )
-
-                self.memory.store(
-                    f"github_event_{data.get('delivery', '')}", data, "github"
+                items.append(
+                    (f"github_event_{data.get('delivery', '')}", data, "github")
                 )
+                self.memory.store_many(items)
                 return {"status": "processed", "event": event}
             except Exception as e:
                 return {"status": "error", "message": str(e)}
 
         @server.route("/agent/github/commits", "GET")
         def github_commits_handler(path):
-            from urllib.parse import parse_qs
-
-            params = parse_qs(path)
-            limit = int(params.get("limit", ["10"])[0])
+            q = dict(parse_qsl(urlsplit(path).query))
+            limit = int(q.get("limit", "10"))
             results = self.memory.search("", cat="github", lim=limit)
             return {"commits": [{"key": r[0], "message": r[1]} for r in results]}
 
@@ -290,13 +364,9 @@ class UnifiedAgent:
     def get_capabilities(self) -> Dict:
         """Return all capabilities"""
         return {
-            "name": self.name,
-            "version": self.version,
+            **self._caps_static,
             "tools_count": len(self.tools.tools),
-            "skills_count": len(list_skills()),
-            "advanced_tools": list(ADVANCED_TOOLS.keys()),
-            "extended_tools": list(EXTENDED_TOOLS.keys()),
-            "memory_categories": ["general", "interaction", "pattern", "skill"],
+            "skills_count": len(self._skill_index),
         }
 
     async def run_interactive(self):
@@ -308,15 +378,18 @@ class UnifiedAgent:
         print(f"Memory: SQLite | MCP: Enabled | HTTP: 8080 | WS: 8765")
         print(f"{'=' * 60}\n")
 
+        loop = asyncio.get_running_loop()
         while self.running:
             try:
-                cmd = input("agent> ").strip()
+                # blocking input() would freeze any servers on this loop
+                cmd = (await loop.run_in_executor(None, input, "agent> ")).strip()
                 if not cmd:
                     continue
-                if cmd.lower() in ["exit", "quit", "q"]:
+                cl = cmd.lower()  # lowercase once, branch on cl below
+                if cl in ("exit", "quit", "q"):
                     self.running = False
                     break
-                if cmd.lower() == "help":
+                if cl == "help":
                     print("\nCommands:")
                     print("  shell <cmd>    - Execute shell")
                     print("  tools          - List tools")
@@ -328,33 +401,33 @@ class UnifiedAgent:
                     print("  ws             - Start WebSocket server")
                     print("  exit           - Quit\n")
                     continue
-                if cmd.lower() == "tools":
+                if cl == "tools":
                     print(json.dumps(self.tools.list(), indent=2))
                     continue
-                if cmd.lower() == "skills":
+                if cl == "skills":
                     print(json.dumps(list_skills()[:20], indent=2))
                     continue
-                if cmd.lower() == "cap":
+                if cl == "cap":
                     print(json.dumps(self.get_capabilities(), indent=2))
                     continue
-                if cmd.lower().startswith("shell "):
+                if cl.startswith("shell "):
                     result = await self.shell(cmd[6:])
                     print(result)
                     continue
-                if cmd.lower().startswith("memory "):
+                if cl.startswith("memory "):
                     result = self.memory.recall(cmd[7:])
                     print(result)
                     continue
-                if cmd.lower().startswith("search "):
+                if cl.startswith("search "):
                     result = await self.search(cmd[7:])
                     for r in result[:10]:
                         print(r)
                     continue
-                if cmd.lower() == "http":
+                if cl == "http":
                     print("Starting HTTP server on port 8080...")
                     await self.start_http_server(8080)
                     continue
-                if cmd.lower() == "ws":
+                if cl == "ws":
                     print("Starting WebSocket server on port 8765...")
                     await self.start_websocket_server(8765)
                     continue
@@ -399,4 +472,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Runner keeps one loop for the whole session instead of per-run setup
+    with asyncio.Runner() as runner:
+        runner.run(main())
@@ -1,17 +1,63 @@
 #!/usr/bin/env python3
 # INTEGRCRIPT
 # VerITY VERIFICATION Sifies all files match expected hashes
+import concurrent.futures
 import hashlib
 import json
 import os
 import sys
 
 MANIFEST_FILE = "INTEGRITY.json"
+CACHE_FILE = "INTEGRITY.cache.json"
+
+try:
+    import ijson  # stream huge manifests instead of loading them whole
+except ImportError:
+    ijson = None
+
+
+def _iter_manifest():
+    # yields (path, expected_hash) as entries are parsed, so hashing can
+    # start before the manifest is fully read
+    if ijson is not None:
+        with open(MANIFEST_FILE, "rb") as f:
+            yield from ijson.kvitems(f, "")
+        return
+    with open(MANIFEST_FILE) as f:
+        yield from json.load(f).items()
 
 
 def hash_file(path):
-    with open(path, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()
+    # stream instead of f.read(): constant memory, and file_digest runs
+    # the whole read/update loop in C (py3.11+)
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = bytearray(1 << 20)
+        mv = memoryview(buf)
+        while n := f.readinto(mv):
+            h.update(mv[:n])
+        return h.hexdigest()
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    # atomic replace so a crash can't leave a truncated cache behind
+    tmp = CACHE_FILE + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
 
 
 def verify():
@@ -19,18 +65,29 @@ def verify():
         print(f"❌ Missing {MANIFEST_FILE}")
         return False
 
-    with open(MANIFEST_FILE) as f:
-        manifest = json.load(f)
-
+    cache = _load_cache()
     errors = []
-    for path, expected_hash in manifest.items():
-        if not os.path.exists(path):
-            errors.append(f"Missing: {path}")
-            continue
-
-        actual = hash_file(path)
-        if actual != expected_hash:
-            errors.append(f"TAMPERED: {path}")
+    # hashlib releases the GIL, so threads hash files in parallel
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = []
+        for path, expected_hash in _iter_manifest():
+            try:
+                st = os.stat(path)
+            except OSError:
+                errors.append(f"Missing: {path}")
+                continue
+            # rsync-style quick check: same size+mtime as last verified run
+            # means we can accept without re-hashing
+            if cache.get(path) == [st.st_size, st.st_mtime_ns, expected_hash]:
+                continue
+            futures.append((path, expected_hash, st, pool.submit(hash_file, path)))
+        for path, expected_hash, st, fut in futures:
+            if fut.result() != expected_hash:
+                errors.append(f"TAMPERED: {path}")
+                cache.pop(path, None)
+            else:
+                cache[path] = [st.st_size, st.st_mtime_ns, expected_hash]
+    _save_cache(cache)
 
     if errors:
         print("❌ INTEGRITY CHECK FAILED:")